@@ -6,31 +6,95 @@ using LangChain and Ollama LLM integration. It identifies tasks, responsible own
 deadlines, priorities, and categories from unstructured email text.
 """
 
-import json
-from typing import List, Dict, Any, Optional
-from langchain_community.llms import Ollama
-from langchain.prompts import PromptTemplate
-from langchain.chains import LLMChain
+import asyncio
+import functools
+import logging
+import os
+import re
+from typing import List, Dict, Any, Optional, Tuple, TypedDict
 
+import orjson
+from langchain.prompts import ChatPromptTemplate
+from langchain.schema import StrOutputParser, SystemMessage
+from langchain.schema.runnable import Runnable
 
-# Valid categories for action items
-VALID_CATEGORIES = ['meeting', 'deadline', 'follow-up', 'approval', 'review']
+from ollama_client import DEFAULT_MODEL, DEFAULT_BASE_URL, get_llm
+from llm_cache import default_cache, make_cache_key
+
+
+logger = logging.getLogger(__name__)
+
+# Valid categories and priorities for action items (frozensets for O(1) membership tests)
+VALID_CATEGORIES = frozenset(('meeting', 'deadline', 'follow-up', 'approval', 'review'))
+_VALID_PRIORITIES = frozenset(('high', 'medium', 'low'))
 
 # Default values for missing fields
 DEFAULT_PRIORITY = 'medium'
 DEFAULT_CATEGORY = 'follow-up'
 
 
-def create_extraction_prompt() -> PromptTemplate:
+class ActionItem(TypedDict):
     """
-    Create a prompt template for extracting action items from email content.
+    A validated action item as returned by the extraction functions.
     
-    Returns:
-        PromptTemplate: Configured prompt template for action item extraction
+    Items stay plain dicts at runtime, since downstream code adds fields such as
+    source_email and summary before writing them out.
     """
-    template = """You are an AI assistant that extracts action items from email content.
+    task: str
+    owner: Optional[str]
+    deadline: Optional[str]
+    priority: str
+    category: str
+
+
+# Keywords used to infer a category the LLM got wrong, in precedence order
+_CATEGORY_KEYWORDS = (
+    ('meeting', ('meet', 'call', 'discussion', 'sync')),
+    ('deadline', ('due', 'deadline', 'submit', 'deliver')),
+    ('approval', ('approve', 'authorization', 'sign off')),
+    ('review', ('review', 'feedback', 'check')),
+)
+
+# All keyword groups compiled into one case-insensitive pattern with a named
+# group per category, so a task description is scanned only once
+_CATEGORY_RE = re.compile(
+    '|'.join(
+        f"(?P<{category}>{'|'.join(re.escape(word) for word in words)})"
+        for category, words in _CATEGORY_KEYWORDS
+    ),
+    re.IGNORECASE
+)
+
+# Span from the first '{' to the last '}' of an LLM response
+_JSON_OBJECT_RE = re.compile(rb'\{.*\}', re.DOTALL)
+
+# Emails shorter than this many characters are only sent to the LLM if they
+# contain an action phrase (see is_trivial_email)
+SHORT_EMAIL_CHARS = 200
+
+# Verbs and phrases that suggest an email asks for something to be done
+_ACTIONABLE_RE = re.compile(
+    r'\b(?:please|need(?:s)? to|by \w+day|deadline|due|asap|review|approve|submit'
+    r'|send|confirm|schedule|sign|follow[- ]up|let me know|can you|could you'
+    r'|action required|remind(?:er)?)\b',
+    re.IGNORECASE
+)
+
+# Maximum number of in-flight Ollama requests during batch extraction.
+# Keep this in line with the server's OLLAMA_NUM_PARALLEL setting.
+OLLAMA_NUM_PARALLEL = int(os.getenv('OLLAMA_NUM_PARALLEL', '4'))
+
+
+# Version of the extraction prompts, part of every cache key.
+# Bump it whenever the prompts below change so stale cached results are ignored.
+PROMPT_VERSION = 'v1'
+
+# Static system instructions for single-email extraction. The email itself is
+# sent as a separate human message, so this text stays byte-identical across
+# calls and Ollama can reuse its cached prefill for it.
+EXTRACTION_SYSTEM_PROMPT = """You are an AI assistant that extracts action items from email content.
 
-Your task is to analyze the email text and identify all actionable tasks, then return them in a structured JSON format.
+Your task is to analyze the email text sent by the user and identify all actionable tasks, then return them in a structured JSON format.
 
 For each action item found, extract the following information:
 - task: A clear description of what needs to be done (REQUIRED)
@@ -47,30 +111,136 @@ Important instructions:
 5. Infer priority and category from context when possible
 6. Return ONLY valid JSON, no additional text or explanation
 
-Email content:
-{email_content}
-
 Return your response as a JSON object with this exact structure:
-{{
+{
   "action_items": [
-    {{
+    {
       "task": "string describing the task",
       "owner": "person's name or null",
       "deadline": "YYYY-MM-DD or null",
       "priority": "high/medium/low",
       "category": "meeting/deadline/follow-up/approval/review"
-    }}
+    }
+  ]
+}"""
+
+# Static system instructions for batched extraction (see EXTRACTION_SYSTEM_PROMPT)
+BATCH_EXTRACTION_SYSTEM_PROMPT = """You are an AI assistant that extracts action items from email content.
+
+Your task is to analyze each of the emails sent by the user and identify all actionable tasks in each one, then return them in a structured JSON format.
+
+For each action item found, extract the following information:
+- task: A clear description of what needs to be done (REQUIRED)
+- owner: The person responsible for completing the task (extract from email if mentioned, otherwise null)
+- deadline: The due date or deadline in ISO format YYYY-MM-DD (extract if mentioned, otherwise null)
+- priority: The urgency level - must be one of: "high", "medium", "low" (infer from context, default to "medium")
+- category: The type of action - must be one of: "meeting", "deadline", "follow-up", "approval", "review" (infer from context)
+
+Important instructions:
+1. Treat every email independently; never mix action items between emails
+2. Return exactly one result entry per email, using the email's number as "email_index"
+3. If an email has no action items, return an empty "action_items" array for it
+4. Use null for missing information (owner, deadline) - do not make up information
+5. Infer priority and category from context when possible
+6. Return ONLY valid JSON, no additional text or explanation
+
+Return your response as a JSON object with this exact structure:
+{
+  "results": [
+    {
+      "email_index": 1,
+      "action_items": [
+        {
+          "task": "string describing the task",
+          "owner": "person's name or null",
+          "deadline": "YYYY-MM-DD or null",
+          "priority": "high/medium/low",
+          "category": "meeting/deadline/follow-up/approval/review"
+        }
+      ]
+    }
   ]
-}}
+}"""
+
+
+def create_extraction_prompt() -> ChatPromptTemplate:
+    """
+    Create a chat prompt template for extracting action items from email content.
+    
+    The instructions are a fixed system message placed first; only the human
+    message carries the email content.
+    
+    Returns:
+        ChatPromptTemplate: Configured prompt template for action item extraction
+    """
+    return ChatPromptTemplate.from_messages([
+        SystemMessage(content=EXTRACTION_SYSTEM_PROMPT),
+        ("human", "{email_content}"),
+    ])
+
 
-JSON Response:"""
+def create_batch_extraction_prompt() -> ChatPromptTemplate:
+    """
+    Create a chat prompt template for extracting action items from several emails at once.
     
-    return PromptTemplate(
-        input_variables=["email_content"],
-        template=template
+    Emails are listed between numbered delimiters in the human message and the
+    LLM is asked to return one result entry per email, so a whole batch costs a
+    single Ollama request.
+    
+    Returns:
+        ChatPromptTemplate: Configured prompt template for batched action item extraction
+    """
+    return ChatPromptTemplate.from_messages([
+        SystemMessage(content=BATCH_EXTRACTION_SYSTEM_PROMPT),
+        ("human", "{emails}"),
+    ])
+
+
+# Prompt templates shared by every extraction call
+EXTRACTION_PROMPT = create_extraction_prompt()
+BATCH_EXTRACTION_PROMPT = create_batch_extraction_prompt()
+
+
+@functools.lru_cache(maxsize=8)
+def _get_llm(model_name: str, base_url: str) -> Runnable:
+    """
+    Return the shared ChatOllama client bound to the extraction settings.
+    
+    The binding is cached per (model_name, base_url) pair and wraps the same
+    client the summarizer uses.
+    """
+    return get_llm(model_name, base_url).bind(
+        format="json",  # Enable JSON mode for structured output
+        temperature=0.1  # Low temperature for more consistent output
     )
 
 
+@functools.lru_cache(maxsize=8)
+def _get_chain(model_name: str, base_url: str) -> Runnable:
+    """
+    Return a cached prompt | llm | parser chain for the given model and server.
+    """
+    return EXTRACTION_PROMPT | _get_llm(model_name, base_url) | StrOutputParser()
+
+
+@functools.lru_cache(maxsize=8)
+def _get_batch_chain(model_name: str, base_url: str) -> Runnable:
+    """
+    Return a cached batched-extraction chain for the given model and server.
+    """
+    return BATCH_EXTRACTION_PROMPT | _get_llm(model_name, base_url) | StrOutputParser()
+
+
+def _cache_key(email_content: str, model_name: str, prompt: str = 'single') -> str:
+    """
+    Return the LLM cache key for extracting action items from one email.
+    
+    prompt names the prompt that produced the result ('single' or 'batch'), so
+    results from the multi-email prompt are never served to single-email calls.
+    """
+    return make_cache_key(model_name, PROMPT_VERSION, prompt, email_content)
+
+
 def parse_llm_response(response: str) -> Dict[str, Any]:
     """
     Parse the LLM's JSON response into a Python dictionary.
@@ -82,78 +252,123 @@ def parse_llm_response(response: str) -> Dict[str, Any]:
         Dict containing parsed action items or error information
     """
     try:
-        # Clean up the response - remove any markdown code blocks if present
-        cleaned_response = response.strip()
-        if cleaned_response.startswith('```json'):
-            cleaned_response = cleaned_response[7:]
-        if cleaned_response.startswith('```'):
-            cleaned_response = cleaned_response[3:]
-        if cleaned_response.endswith('```'):
-            cleaned_response = cleaned_response[:-3]
-        cleaned_response = cleaned_response.strip()
+        # Locate the outermost JSON object in one pass; this skips markdown
+        # code fences and any text around the object without copying it
+        match = _JSON_OBJECT_RE.search(response.encode('utf-8'))
+        if match is None:
+            return {"action_items": [], "error": "JSON parsing error: no JSON object in response"}
         
         # Parse JSON
-        parsed = json.loads(cleaned_response)
+        parsed = orjson.loads(match.group(0))
         return parsed
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         # If JSON parsing fails, return empty structure
         return {"action_items": [], "error": f"JSON parsing error: {str(e)}"}
     except Exception as e:
         return {"action_items": [], "error": f"Unexpected error: {str(e)}"}
 
 
-def validate_action_item(item: Dict[str, Any]) -> Dict[str, Any]:
+def looks_actionable(text: str) -> bool:
+    """
+    Cheap check for phrases that usually accompany an action item.
+    
+    Args:
+        text: Email content
+        
+    Returns:
+        True if the text contains an action verb or phrase
+    """
+    return _ACTIONABLE_RE.search(text) is not None
+
+
+def is_trivial_email(text: str) -> bool:
+    """
+    Check whether an email is too short and passive to be worth an LLM call.
+    
+    Short notifications without any action phrase rarely contain action
+    items, so callers can skip summarization and extraction for them.
+    
+    Args:
+        text: Email content
+        
+    Returns:
+        True if the email is under SHORT_EMAIL_CHARS and not actionable
+    """
+    return len(text) < SHORT_EMAIL_CHARS and not looks_actionable(text)
+
+
+def infer_category(task: str) -> str:
+    """
+    Infer an action item category from keywords in its task description.
+    
+    Args:
+        task: Task description
+        
+    Returns:
+        The highest-precedence category whose keywords appear in the task,
+        or DEFAULT_CATEGORY if none do
+    """
+    matched = {match.lastgroup for match in _CATEGORY_RE.finditer(task)}
+    for category, _ in _CATEGORY_KEYWORDS:
+        if category in matched:
+            return category
+    return DEFAULT_CATEGORY
+
+
+def validate_action_item(item: Dict[str, Any], *,
+                         _valid_priorities: frozenset = _VALID_PRIORITIES,
+                         _valid_categories: frozenset = VALID_CATEGORIES,
+                         _default_priority: str = DEFAULT_PRIORITY,
+                         _default_category: str = DEFAULT_CATEGORY) -> Optional[ActionItem]:
     """
     Validate and normalize a single action item.
     
+    The keyword-only arguments bind the module constants as locals at definition
+    time, since this runs once per extracted item; callers should not pass them.
+    
     Args:
         item: Raw action item dictionary from LLM
         
     Returns:
-        Validated and normalized action item dictionary
+        Validated and normalized action item dictionary, or None if the item
+        has no task description
     """
-    validated = {}
-    
     # Task description is required
-    validated['task'] = item.get('task', '').strip()
-    if not validated['task']:
+    task = item.get('task', '').strip()
+    if not task:
         return None  # Invalid item without task description
     
     # Owner can be null or a string
     owner = item.get('owner')
-    validated['owner'] = owner if owner and str(owner).strip().lower() != 'null' else None
+    if not owner or str(owner).strip().lower() == 'null':
+        owner = None
     
     # Deadline can be null or a date string
     deadline = item.get('deadline')
-    validated['deadline'] = deadline if deadline and str(deadline).strip().lower() != 'null' else None
+    if not deadline or str(deadline).strip().lower() == 'null':
+        deadline = None
     
     # Priority must be one of the valid values, default to medium
-    priority = item.get('priority', DEFAULT_PRIORITY).lower()
-    if priority not in ['high', 'medium', 'low']:
-        priority = DEFAULT_PRIORITY
-    validated['priority'] = priority
+    priority = item.get('priority', _default_priority).lower()
+    if priority not in _valid_priorities:
+        priority = _default_priority
     
     # Category must be one of the valid categories
-    category = item.get('category', DEFAULT_CATEGORY).lower()
-    if category not in VALID_CATEGORIES:
+    category = item.get('category', _default_category).lower()
+    if category not in _valid_categories:
         # Try to infer category based on keywords in task
-        task_lower = validated['task'].lower()
-        if any(word in task_lower for word in ['meet', 'call', 'discussion', 'sync']):
-            category = 'meeting'
-        elif any(word in task_lower for word in ['due', 'deadline', 'submit', 'deliver']):
-            category = 'deadline'
-        elif any(word in task_lower for word in ['approve', 'authorization', 'sign off']):
-            category = 'approval'
-        elif any(word in task_lower for word in ['review', 'feedback', 'check']):
-            category = 'review'
-        else:
-            category = DEFAULT_CATEGORY
-    validated['category'] = category
+        category = infer_category(task)
     
-    return validated
+    return {
+        'task': task,
+        'owner': owner,
+        'deadline': deadline,
+        'priority': priority,
+        'category': category,
+    }
 
 
-def validate_and_normalize(parsed_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+def validate_and_normalize(parsed_data: Dict[str, Any]) -> List[ActionItem]:
     """
     Validate and normalize the complete parsed response.
     
@@ -181,20 +396,76 @@ def validate_and_normalize(parsed_data: Dict[str, Any]) -> List[Dict[str, Any]]:
     return validated_items
 
 
-def extract_action_items(email_content: str, model_name: str = "llama3.1", 
-                        base_url: str = "http://localhost:11434") -> List[Dict[str, Any]]:
+async def aextract_action_items(email_content: str, model_name: str = DEFAULT_MODEL,
+                                base_url: str = DEFAULT_BASE_URL) -> List[ActionItem]:
+    """
+    Asynchronously extract action items from email content using LangChain and Ollama.
+    
+    Awaits the Ollama HTTP call instead of blocking on it, so several emails can
+    be in flight at once. Results are cached on disk by model, prompt version and
+    email content, so unchanged emails skip the LLM on later runs; cache file
+    I/O runs in the default executor so it never blocks the event loop. See
+    extract_action_items for the returned structure.
+    
+    Args:
+        email_content: The raw email text to analyze
+        model_name: Name of the Ollama model to use (default: DEFAULT_MODEL)
+        base_url: Base URL for Ollama API (default: http://localhost:11434)
+        
+    Returns:
+        List of validated action item dictionaries, or an empty list if no
+        action items were found or processing failed.
+    """
+    loop = asyncio.get_running_loop()
+    
+    items = await loop.run_in_executor(None, _items_without_llm, email_content, model_name)
+    if items is not None:
+        return items
+    
+    items, well_formed = await _aextract_from_llm(email_content, model_name, base_url)
+    
+    # Only cache well-formed responses
+    if well_formed:
+        await loop.run_in_executor(
+            None, default_cache.set, _cache_key(email_content, model_name), items, model_name
+        )
+    
+    return items
+
+
+async def _aextract_from_llm(email_content: str, model_name: str,
+                             base_url: str) -> Tuple[List[ActionItem], bool]:
+    """
+    Send one email through the extraction chain without touching the cache.
+    
+    Returns:
+        (items, well_formed) as from _items_from_response; ([], False) if the
+        call fails
+    """
+    try:
+        # Run the cached chain without blocking the event loop
+        response = await _get_chain(model_name, base_url).ainvoke({"email_content": email_content})
+        return _items_from_response(response)
+    except Exception as e:
+        # Log error and return empty list
+        logger.error("Error during action item extraction: %s", e)
+        return [], False
+
+
+def extract_action_items(email_content: str, model_name: str = DEFAULT_MODEL,
+                        base_url: str = DEFAULT_BASE_URL) -> List[ActionItem]:
     """
     Extract action items from email content using LangChain and Ollama.
     
     This is the main function that orchestrates the extraction process:
-    1. Connects to Ollama LLM
-    2. Creates the extraction prompt
-    3. Processes the email content
+    1. Reuses the cached Ollama LLM and extraction chain
+    2. Sends the email content through the extraction prompt
+    3. Processes the LLM response
     4. Parses and validates the results
     
     Args:
         email_content: The raw email text to analyze
-        model_name: Name of the Ollama model to use (default: llama3.1)
+        model_name: Name of the Ollama model to use (default: DEFAULT_MODEL)
         base_url: Base URL for Ollama API (default: http://localhost:11434)
         
     Returns:
@@ -228,62 +499,271 @@ def extract_action_items(email_content: str, model_name: str = "llama3.1",
             }
         ]
     """
-    # Validate input
-    if not email_content or not isinstance(email_content, str):
+    items = _items_without_llm(email_content, model_name)
+    if items is not None:
+        return items
+    
+    try:
+        # Reuse the cached chain for this model/server
+        response = _get_chain(model_name, base_url).invoke({"email_content": email_content})
+        items, well_formed = _items_from_response(response)
+    except Exception as e:
+        # Log error and return empty list
+        logger.error("Error during action item extraction: %s", e)
         return []
     
-    if not email_content.strip():
+    # Only cache well-formed responses
+    if well_formed:
+        default_cache.set(_cache_key(email_content, model_name), items, model=model_name)
+    
+    return items
+
+
+def _items_without_llm(email_content: str, model_name: str,
+                       prompt: str = 'single') -> Optional[List[ActionItem]]:
+    """
+    Return [] for blank input, the cached items (from the given prompt) on a
+    cache hit, or None if the LLM has to be called.
+    """
+    if not email_content or not isinstance(email_content, str) or not email_content.strip():
         return []
     
-    try:
-        # Initialize Ollama LLM with JSON format
-        llm = Ollama(
-            model=model_name,
-            base_url=base_url,
-            format="json",  # Enable JSON mode for structured output
-            temperature=0.1  # Low temperature for more consistent output
-        )
+    return default_cache.get(_cache_key(email_content, model_name, prompt), model=model_name)
+
+
+def _items_from_response(response: str) -> Tuple[List[ActionItem], bool]:
+    """
+    Parse and validate one extraction response.
+    
+    Returns:
+        (items, well_formed): the validated action items, and whether the
+        response parsed cleanly (only well-formed responses are cached)
+    """
+    parsed_data = parse_llm_response(response)
+    return validate_and_normalize(parsed_data), 'error' not in parsed_data
+
+
+async def aextract_action_items_batch(emails: List[str], model_name: str = DEFAULT_MODEL,
+                                      base_url: str = DEFAULT_BASE_URL,
+                                      max_concurrency: int = OLLAMA_NUM_PARALLEL) -> List[List[ActionItem]]:
+    """
+    Asynchronously extract action items from multiple emails concurrently.
+    
+    Requests are fanned out with asyncio.gather and capped by a semaphore so
+    that no more than max_concurrency calls are in flight at once. The cache is
+    read once before the fan-out and written once after it, both in the
+    default executor, so file I/O never stalls the in-flight requests.
+    
+    Args:
+        emails: List of email content strings
+        model_name: Name of the Ollama model to use
+        base_url: Base URL for Ollama API
+        max_concurrency: Maximum number of concurrent Ollama requests
+                         (default: OLLAMA_NUM_PARALLEL)
         
-        # Create prompt template
-        prompt = create_extraction_prompt()
+    Returns:
+        List of lists, where each inner list contains action items for one email,
+        in the same order as the input emails
+    """
+    loop = asyncio.get_running_loop()
+    
+    results, pending = await loop.run_in_executor(None, _lookup_cached, emails, model_name)
+    if not pending:
+        return results
+    
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    
+    async def _extract_one(index: int) -> Tuple[List[ActionItem], bool]:
+        async with semaphore:
+            return await _aextract_from_llm(emails[index], model_name, base_url)
+    
+    extracted = await asyncio.gather(*(_extract_one(index) for index in pending))
+    
+    to_cache = {}
+    for index, (items, well_formed) in zip(pending, extracted):
+        results[index] = items
         
-        # Create LangChain chain
-        chain = LLMChain(llm=llm, prompt=prompt)
+        # Only cache well-formed responses
+        if well_formed:
+            to_cache[_cache_key(emails[index], model_name)] = items
+    
+    # Persist the whole batch with a single cache write
+    await loop.run_in_executor(None, default_cache.set_many, to_cache, model_name)
+    
+    return results
+
+
+def extract_action_items_batch(emails: List[str], model_name: str = DEFAULT_MODEL,
+                               base_url: str = DEFAULT_BASE_URL,
+                               max_concurrency: int = OLLAMA_NUM_PARALLEL) -> List[List[ActionItem]]:
+    """
+    Extract action items from multiple emails in batch.
+    
+    Emails are sent through the chain's batch() call, which runs up to
+    max_concurrency requests at a time, so total wall time is bounded by the
+    slowest requests rather than the sum of all of them. Empty emails and emails
+    with a cached result never reach the LLM.
+    
+    Args:
+        emails: List of email content strings
+        model_name: Name of the Ollama model to use
+        base_url: Base URL for Ollama API
+        max_concurrency: Maximum number of concurrent Ollama requests
+                         (default: OLLAMA_NUM_PARALLEL)
         
-        # Run the chain
-        response = chain.run(email_content=email_content)
+    Returns:
+        List of lists, where each inner list contains action items for one email
+    """
+    results, pending = _lookup_cached(emails, model_name)
+    if not pending:
+        return results
+    
+    chain = _get_chain(model_name, base_url)
+    responses = chain.batch(
+        [{"email_content": emails[index]} for index in pending],
+        config={"max_concurrency": max(1, max_concurrency)},
+        return_exceptions=True
+    )
+    
+    to_cache = {}
+    for index, response in zip(pending, responses):
+        if isinstance(response, Exception):
+            logger.error("Error during action item extraction: %s", response)
+            continue
         
-        # Parse the response
-        parsed_data = parse_llm_response(response)
+        results[index], well_formed = _items_from_response(response)
         
-        # Validate and normalize
-        validated_items = validate_and_normalize(parsed_data)
+        # Only cache well-formed responses
+        if well_formed:
+            to_cache[_cache_key(emails[index], model_name)] = results[index]
+    
+    # Persist the whole batch with a single cache write
+    default_cache.set_many(to_cache, model=model_name)
+    
+    return results
+
+
+def _lookup_cached(emails: List[str], model_name: str,
+                   prompt: str = 'single') -> Tuple[List[List[ActionItem]], List[int]]:
+    """
+    Answer what a batch call can without the LLM.
+    
+    Args:
+        emails: List of email content strings
+        model_name: Name of the Ollama model to use
+        prompt: Prompt whose cached results may be used ('single' or 'batch')
+    
+    Returns:
+        (results, pending): per-email result lists, pre-filled from the cache
+        (empty for blank emails), and the indices of emails still to be sent
+    """
+    results = [[] for _ in emails]
+    pending = []
+    
+    for index, email_content in enumerate(emails):
+        items = _items_without_llm(email_content, model_name, prompt)
+        if items is not None:
+            results[index] = items
+        else:
+            pending.append(index)
+    
+    return results, pending
+
+
+def _format_email_batch(emails: List[str]) -> str:
+    """
+    Join emails into a single block with numbered delimiters (1-based).
+    """
+    return "\n\n".join(
+        f"=== EMAIL {index} ===\n{email_content.strip()}\n=== END EMAIL {index} ==="
+        for index, email_content in enumerate(emails, start=1)
+    )
+
+
+def route_batch_results(parsed_data: Dict[str, Any], batch_size: int) -> List[Optional[List[ActionItem]]]:
+    """
+    Route the action items of a batched LLM response back to their emails.
+    
+    Args:
+        parsed_data: Parsed JSON data from the batched LLM response
+        batch_size: Number of emails that were sent in the batch
         
-        return validated_items
+    Returns:
+        List of batch_size entries in email order. Each entry is the list of
+        validated action items for that email, or None if the email is
+        missing from the response.
+    """
+    routed = [None] * batch_size
+    
+    if 'error' in parsed_data:
+        return routed
+    
+    results = parsed_data.get('results', [])
+    if not isinstance(results, list):
+        return routed
+    
+    for result in results:
+        if not isinstance(result, dict):
+            continue
         
-    except Exception as e:
-        # Log error and return empty list
-        print(f"Error during action item extraction: {str(e)}")
-        return []
+        try:
+            index = int(result.get('email_index')) - 1
+        except (TypeError, ValueError):
+            continue
+        
+        if 0 <= index < batch_size:
+            items = validate_and_normalize({'action_items': result.get('action_items', [])})
+            routed[index] = (routed[index] or []) + items
+    
+    return routed
 
 
-def extract_action_items_batch(emails: List[str], model_name: str = "llama3.1",
-                               base_url: str = "http://localhost:11434") -> List[List[Dict[str, Any]]]:
+def extract_action_items_batched(emails: List[str], batch_size: int = 8,
+                                 model_name: str = DEFAULT_MODEL,
+                                 base_url: str = DEFAULT_BASE_URL) -> List[List[ActionItem]]:
     """
-    Extract action items from multiple emails in batch.
+    Extract action items from multiple emails using one LLM request per batch.
+    
+    Up to batch_size emails are packed into a single prompt, so N emails cost
+    ceil(N / batch_size) Ollama round-trips instead of N. Emails with a cached
+    result are answered from the cache and never sent to the LLM.
     
     Args:
         emails: List of email content strings
+        batch_size: Maximum number of emails per LLM request (default: 8)
         model_name: Name of the Ollama model to use
         base_url: Base URL for Ollama API
         
     Returns:
-        List of lists, where each inner list contains action items for one email
+        List of lists, where each inner list contains action items for one email,
+        in the same order as the input emails
     """
-    results = []
-    for email_content in emails:
-        items = extract_action_items(email_content, model_name, base_url)
-        results.append(items)
+    results, pending = _lookup_cached(emails, model_name, 'batch')
+    
+    chain = _get_batch_chain(model_name, base_url)
+    batch_size = max(1, batch_size)
+    
+    for start in range(0, len(pending), batch_size):
+        window = pending[start:start + batch_size]
+        
+        try:
+            response = chain.invoke({
+                "emails": _format_email_batch([emails[index] for index in window])
+            })
+            routed = route_batch_results(parse_llm_response(response), len(window))
+        except Exception as e:
+            logger.error("Error during batched action item extraction: %s", e)
+            continue
+        
+        to_cache = {}
+        for index, items in zip(window, routed):
+            if items is not None:
+                results[index] = items
+                to_cache[_cache_key(emails[index], model_name, 'batch')] = items
+        
+        # One cache write per LLM request
+        default_cache.set_many(to_cache, model=model_name)
+    
     return results
 
 
@@ -9,13 +9,50 @@ This module orchestrates the email processing workflow including:
 - Outputting structured JSON results
 """
 
+import logging
 import os
-import json
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+import orjson
+
+from email_reader import read_email
 from summarizer import create_summarizer, EmailSummarizer
+from action_extractor import extract_action_items, is_trivial_email
+from ollama_client import DEFAULT_MODEL, check_ollama, preload_model
+
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of summarized emails waiting for action item extraction
+PIPELINE_QUEUE_SIZE = 4
+
+# Maximum number of email files read ahead of the summarizer
+PIPELINE_READ_AHEAD = 8
+
+# Sentinel marking the end of a pipeline stage's output
+_STAGE_DONE = object()
+
+
+def _put_unless_stopped(target: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    """
+    Put item on a bounded queue, giving up once stop is set.
+    
+    Returns:
+        True if the item was queued, False if the pipeline was stopped first
+    """
+    while not stop.is_set():
+        try:
+            target.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
 
 
 class EmailProcessor:
@@ -29,17 +66,33 @@ class EmailProcessor:
     - Task prioritization
     """
     
-    def __init__(self, emails_dir: str = "emails", output_file: str = "action_items.json"):
+    def __init__(self, emails_dir: str = "emails", output_file: str = "action_items.json",
+                 model_name: str = DEFAULT_MODEL):
         """
         Initialize the EmailProcessor.
         
         Args:
             emails_dir: Directory containing email .txt files
             output_file: Path to output JSON file for results
+            model_name: Ollama model to use (default: DEFAULT_MODEL)
+            
+        Raises:
+            RuntimeError: If Ollama is not running or the model is not available
         """
+        # Fail fast instead of sending every email through the LLM error fallback
+        if not check_ollama(model_name):
+            raise RuntimeError(
+                f"Ollama is not ready to serve '{model_name}'. "
+                "Make sure 'ollama serve' is running and the model has been pulled."
+            )
+        
         self.emails_dir = Path(emails_dir)
         self.output_file = Path(output_file)
-        self.summarizer = create_summarizer()
+        self.model_name = model_name
+        self.summarizer = create_summarizer(model_name=model_name)
+        
+        # Warm the model into memory so the first email doesn't pay the cold start
+        preload_model(model_name)
         
         # Create emails directory if it doesn't exist
         self.emails_dir.mkdir(exist_ok=True)
@@ -54,29 +107,43 @@ class EmailProcessor:
         Returns:
             Dictionary with email content and metadata
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = read_email(str(file_path))
         
         return {
             'filename': file_path.name,
+            'source_path': str(file_path),
             'content': content,
             'timestamp': datetime.now().isoformat()
         }
     
-    def process_email(self, email_data: Dict[str, Any]) -> Dict[str, Any]:
+    def process_email(self, email_data: Dict[str, Any],
+                      trivial: Optional[bool] = None) -> Dict[str, Any]:
         """
         Process a single email through the pipeline.
         
         Args:
             email_data: Dictionary containing email content and metadata
+            trivial: Result of is_trivial_email for the content, if the caller
+                     already computed it
             
         Returns:
-            Dictionary with processed email data including summary
+            Dictionary with processed email data including summary. The email
+            body itself is not kept; re-read it from 'source_path' if needed.
         """
         email_content = email_data['content']
+        if trivial is None:
+            trivial = is_trivial_email(email_content)
         
-        # Generate summary using the summarization chain
-        summary = self.summarizer.summarize(email_content)
+        # Empty and very short emails keep the summarizer's fixed summaries;
+        # other short non-actionable emails get a templated summary instead of
+        # an LLM call
+        summary = self.summarizer.shortcut_summary(email_content)
+        if summary is None:
+            if trivial:
+                summary = f"Short non-actionable message: {email_content[:120]}"
+            else:
+                # Generate summary using the summarization chain
+                summary = self.summarizer.summarize(email_content)
         
         # Build processed email structure
         processed = {
@@ -85,17 +152,89 @@ class EmailProcessor:
             'timestamp': email_data['timestamp'],
             'summary': summary,
             'content_length': len(email_content),
-            'raw_content': email_content
+            'source_path': email_data.get('source_path')
         }
         
         return processed
     
+    def _summarize_stage(self, executor: Executor, email_files: List[Path],
+                         summary_queue: queue.Queue, stop: threading.Event) -> None:
+        """
+        Summarize emails in order as their reads complete (pipeline stage 2).
+        
+        Reads (stage 1) run on executor with at most PIPELINE_READ_AHEAD files
+        in flight; a new read is submitted each time one is consumed, and consumed
+        reads are popped off the window so their content can be freed once
+        extracted.
+        Each summarized email is put on summary_queue together with its content
+        and whether it is trivial (see is_trivial_email); _STAGE_DONE is put
+        last. Emails that fail to read or summarize are skipped. Once stop is
+        set (the extraction stage has exited), no further files are read or
+        summarized and pending reads are cancelled.
+        
+        Args:
+            executor: Executor that runs the file reads
+            email_files: Email file paths, in processing order
+            summary_queue: Bounded queue feeding the extraction stage
+            stop: Set by the extraction stage when it stops consuming
+        """
+        remaining = iter(email_files)
+        reads = deque()
+        
+        def read_next() -> None:
+            email_file = next(remaining, None)
+            if email_file is not None:
+                reads.append((email_file, executor.submit(self.read_email_file, email_file)))
+        
+        try:
+            for _ in range(PIPELINE_READ_AHEAD):
+                read_next()
+            
+            while reads and not stop.is_set():
+                email_file, read_future = reads.popleft()
+                read_next()
+                
+                try:
+                    logger.info("Processing: %s", email_file.name)
+                    
+                    # Wait for the email file read (re-raises read errors)
+                    email_data = read_future.result()
+                    
+                    # Decide once whether this email needs the LLM at all
+                    trivial = is_trivial_email(email_data['content'])
+                    
+                    if stop.is_set():
+                        break
+                    
+                    # Process email (including summarization)
+                    processed = self.process_email(email_data, trivial)
+                    
+                    logger.info("✓ Summary: %.100s...", processed['summary'])
+                    
+                    # Blocks while the extraction stage is behind
+                    _put_unless_stopped(summary_queue, (processed, email_data['content'], trivial), stop)
+                    
+                except Exception as e:
+                    logger.error("✗ Error processing %s: %s", email_file.name, e)
+                    continue
+        finally:
+            for _, read_future in reads:
+                read_future.cancel()
+            _put_unless_stopped(summary_queue, _STAGE_DONE, stop)
+    
     def process_all_emails(self) -> List[Dict[str, Any]]:
         """
         Process all email files in the emails directory.
         
+        Runs as a three-stage pipeline so the stages overlap: files are read by
+        a thread pool a bounded number of files ahead, a summarizer thread
+        consumes the reads in order, and action items are extracted on the
+        calling thread from a bounded queue of summarized emails. Throughput is
+        limited by the slowest stage rather than the sum of all of them, and
+        only a bounded number of email bodies is held in memory at a time.
+        
         Returns:
-            List of processed email dictionaries with summaries
+            List of processed email dictionaries with summaries and action items
         """
         processed_emails = []
         
@@ -103,28 +242,48 @@ class EmailProcessor:
         email_files = sorted(self.emails_dir.glob("*.txt"))
         
         if not email_files:
-            print(f"No email files found in {self.emails_dir}")
+            logger.warning("No email files found in %s", self.emails_dir)
             return processed_emails
         
-        print(f"Processing {len(email_files)} email(s)...")
+        logger.info("Processing %d email(s)...", len(email_files))
         
-        for email_file in email_files:
+        summary_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        stop = threading.Event()
+        
+        with ThreadPoolExecutor(max_workers=min(PIPELINE_READ_AHEAD, len(email_files))) as executor:
+            # Stages 1 and 2: read ahead and summarize in a background thread
+            summarizer_thread = threading.Thread(
+                target=self._summarize_stage,
+                args=(executor, email_files, summary_queue, stop),
+                daemon=True
+            )
+            summarizer_thread.start()
+            
             try:
-                print(f"  - Processing: {email_file.name}")
-                
-                # Read email file
-                email_data = self.read_email_file(email_file)
-                
-                # Process email (including summarization)
-                processed = self.process_email(email_data)
-                
-                processed_emails.append(processed)
-                
-                print(f"    ✓ Summary: {processed['summary'][:100]}...")
-                
-            except Exception as e:
-                print(f"    ✗ Error processing {email_file.name}: {str(e)}")
-                continue
+                # Stage 3: extract action items as summaries arrive
+                while True:
+                    entry = summary_queue.get()
+                    if entry is _STAGE_DONE:
+                        break
+                    
+                    processed, email_content, trivial = entry
+                    if trivial:
+                        logger.debug("Skipping extraction for short non-actionable email %s",
+                                     processed['filename'])
+                        processed['action_items'] = []
+                    else:
+                        processed['action_items'] = extract_action_items(
+                            email_content, model_name=self.model_name
+                        )
+                    processed_emails.append(processed)
+                    
+                    logger.info("✓ Action items: %d from %s",
+                                len(processed['action_items']), processed['filename'])
+            finally:
+                # Stop the summarizer if extraction bailed out early, and wait
+                # for it before the executor shuts down
+                stop.set()
+                summarizer_thread.join()
         
         return processed_emails
     
@@ -141,8 +300,10 @@ class EmailProcessor:
             'emails': processed_emails
         }
         
-        with open(self.output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        # Serialize straight to UTF-8 bytes and write them in one call
+        data = orjson.dumps(output_data, option=orjson.OPT_INDENT_2)
+        with open(self.output_file, 'wb') as f:
+            f.write(data)
         
         print(f"\nResults saved to: {self.output_file}")
     
@@ -183,7 +344,12 @@ def main():
     Main entry point for the email processing pipeline.
     """
     # Create and run the processor
-    processor = EmailProcessor()
+    try:
+        processor = EmailProcessor()
+    except RuntimeError as e:
+        logger.error("%s", e)
+        return
+    
     results = processor.run()
     
     # Display summary statistics
@@ -195,7 +361,12 @@ def main():
             print(f"\n📧 {email['email_id']}")
             print(f"   Summary: {email['summary']}")
             print(f"   Content Length: {email['content_length']} characters")
+            print(f"   Action Items: {len(email.get('action_items', []))}")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
     main()
@@ -6,16 +6,18 @@ and return their contents in a structured format for downstream processing.
 """
 
 import logging
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Library module: callers configure logging (see the __main__ block below)
 logger = logging.getLogger(__name__)
 
+# Files at least this large are memory-mapped rather than read into a bytes copy
+_MMAP_THRESHOLD = 64 * 1024
+
 
 def read_emails(emails_dir: str = "emails") -> List[Dict[str, str]]:
     """
@@ -63,38 +65,115 @@ def read_emails(emails_dir: str = "emails") -> List[Dict[str, str]]:
     
     logger.info(f"Found {len(txt_files)} .txt file(s) in '{emails_dir}'")
     
-    # Read each file with encoding fallbacks
-    for file_path in txt_files:
-        try:
-            content = _read_file_with_fallback(file_path)
-            results.append({
-                "filename": file_path.name,
-                "content": content
-            })
-            logger.info(f"Successfully read: {file_path.name}")
-        except Exception as e:
-            logger.error(f"Failed to read {file_path.name}: {e}")
-            # Skip this file and continue with others
-            continue
+    # Read files concurrently (with encoding fallbacks) to overlap disk I/O
+    with ThreadPoolExecutor(max_workers=min(32, len(txt_files))) as executor:
+        contents = list(executor.map(_read_file_with_fallback_safe, txt_files))
+    
+    # Skip files that failed to read, keeping the sorted order
+    results = [
+        {"filename": file_path.name, "content": content}
+        for file_path, content in zip(txt_files, contents)
+        if content is not None
+    ]
     
     logger.info(f"Successfully processed {len(results)} out of {len(txt_files)} files")
     return results
 
 
+def _read_file_with_fallback_safe(file_path: Path) -> Optional[str]:
+    """
+    Read a file with _read_file_with_fallback, logging instead of raising on failure.
+    
+    Args:
+        file_path (Path): Path to the file to read
+    
+    Returns:
+        Optional[str]: File content, or None if the file could not be read
+    """
+    try:
+        content = _read_file_with_fallback(file_path)
+        logger.info(f"Successfully read: {file_path.name}")
+        return content
+    except Exception as e:
+        logger.error(f"Failed to read {file_path.name}: {e}")
+        return None
+
+
+def read_email(file_path: str) -> str:
+    """
+    Read a single email file with encoding fallbacks.
+    
+    Args:
+        file_path (str): Path to the email .txt file
+    
+    Returns:
+        str: Full text content of the email
+    
+    Raises:
+        Exception: If the file cannot be read or decoded
+    """
+    return _read_file_with_fallback(Path(file_path))
+
+
 def _read_file_with_fallback(file_path: Path) -> str:
     """
     Read a file with multiple encoding attempts.
     
+    The file is read from disk once; the encodings are then tried in memory.
+    Smaller files are read with raw os.read calls sized to the file, skipping
+    the buffered file object; files of _MMAP_THRESHOLD bytes or more are
+    memory-mapped and decoded straight from the mapped pages instead of being
+    copied into a bytes object first.
+    
+    Args:
+        file_path (Path): Path to the file to read
+    
+    Returns:
+        str: File content as a string
+    
+    Raises:
+        Exception: If the file cannot be read or all encoding attempts fail
+    """
+    try:
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            size = os.fstat(fd).st_size
+            if size < _MMAP_THRESHOLD:
+                # One read normally returns the whole file; keep reading until
+                # EOF in case it is short or the file grew
+                chunks = [os.read(fd, size + 1)]
+                while chunks[-1]:
+                    chunks.append(os.read(fd, _MMAP_THRESHOLD))
+                data = chunks[0] if len(chunks) == 2 else b''.join(chunks)
+            else:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                    return _decode_with_fallback(mapped, file_path.name)
+        finally:
+            os.close(fd)
+    except (OSError, ValueError) as e:
+        # Permissions, file not found, etc.
+        raise Exception(f"Error reading {file_path.name}: {e}")
+    
+    return _decode_with_fallback(data, file_path.name)
+
+
+def _decode_with_fallback(data, filename: str) -> str:
+    """
+    Decode file bytes with multiple encoding attempts.
+    
     Tries encodings in order:
     1. UTF-8 (most common)
     2. latin-1 (ISO-8859-1)
     3. cp1252 (Windows-1252)
     
+    Line endings are normalized to '\\n', as with text-mode reads.
+    
     Args:
-        file_path (Path): Path to the file to read
+        data: Raw file content (bytes or any bytes-like object, e.g. an mmap)
+        filename (str): File name used in log and error messages
     
     Returns:
-        str: File content as a string
+        str: Decoded content
     
     Raises:
         Exception: If all encoding attempts fail
@@ -103,34 +182,35 @@ def _read_file_with_fallback(file_path: Path) -> str:
     
     for encoding in encodings:
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                content = f.read()
-            
-            # Log warning if fallback encoding was used
-            if encoding != 'utf-8':
-                logger.warning(
-                    f"File {file_path.name} read with fallback encoding: {encoding}"
-                )
-            
-            return content
-            
+            content = str(data, encoding)
         except UnicodeDecodeError:
-            if encoding == encodings[-1]:
-                # Last encoding attempt failed
-                raise Exception(
-                    f"Failed to decode {file_path.name} with any supported encoding"
-                )
             # Try next encoding
             continue
-        except Exception as e:
-            # Other errors (permissions, file not found, etc.)
-            raise Exception(f"Error reading {file_path.name}: {e}")
-    
-    # Should never reach here, but for completeness
-    raise Exception(f"Unexpected error reading {file_path.name}")
+        
+        # Log warning if fallback encoding was used
+        if encoding != 'utf-8':
+            logger.warning(
+                f"File {filename} read with fallback encoding: {encoding}"
+            )
+        
+        # Match text-mode universal newline handling
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        
+        return content
+    
+    raise Exception(
+        f"Failed to decode {filename} with any supported encoding"
+    )
 
 
 if __name__ == "__main__":
+    # Configure logging only when run as a script
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     # Test the email reader
     print("Testing email reader...")
     emails = read_emails()
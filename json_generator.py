@@ -5,11 +5,70 @@ This module handles the generation of JSON output from sorted action items
 and writes them to a file in the project root directory.
 """
 
-import json
+import logging
+import re
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+import orjson
+
+
+logger = logging.getLogger(__name__)
+
+# Fields every task must have before it is written out
+_REQUIRED_FIELDS = frozenset(('task', 'owner', 'deadline', 'priority', 'category', 'source_email', 'summary'))
+
+# Non-ISO date shapes mapped to the strptime formats that can parse them,
+# tried in order. Like strptime, the shapes accept any run of whitespace where
+# the formats have a space. ISO 8601 strings are handled by datetime.fromisoformat.
+_DATE_DISPATCH = (
+    (re.compile(r"^\d{4}-\d{1,2}-\d{1,2}$"), ("%Y-%m-%d",)),
+    (re.compile(r"^\d{1,2}/\d{1,2}/\d{4}$"), ("%m/%d/%Y", "%d/%m/%Y")),
+    (re.compile(r"^\d{4}/\d{1,2}/\d{1,2}$"), ("%Y/%m/%d",)),
+    (re.compile(r"^[A-Za-z]+\s+\d{1,2},\s+\d{4}$"), ("%B %d, %Y", "%b %d, %Y")),
+    (re.compile(r"^\d{1,2}\s+[A-Za-z]+\s+\d{4}$"), ("%d %B %Y", "%d %b %Y")),
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_string(date_value: str) -> Optional[str]:
+    """
+    Parse a date string to ISO 8601 (YYYY-MM-DD).
+    
+    Deadlines repeat heavily across tasks, so results are cached.
+    
+    Args:
+        date_value: Date string in one of the supported formats
+        
+    Returns:
+        ISO 8601 formatted date string or None if the string could not be parsed
+    """
+    # Try ISO format first, but only for strings that start like one (a
+    # four-digit year) so other shapes don't pay for a raised ValueError
+    if date_value[:4].isdigit():
+        try:
+            parsed_date = datetime.fromisoformat(date_value.replace('Z', '+00:00'))
+            return parsed_date.strftime("%Y-%m-%d")
+        except ValueError:
+            pass
+    
+    # Dispatch on the string's shape so only matching formats are attempted
+    stripped = date_value.strip()
+    for pattern, formats in _DATE_DISPATCH:
+        if not pattern.match(stripped):
+            continue
+        
+        for fmt in formats:
+            try:
+                return datetime.strptime(stripped, fmt).strftime("%Y-%m-%d")
+            except ValueError:
+                continue
+        break
+    
+    return None
+
 
 def format_date_iso8601(date_value: Any) -> Optional[str]:
     """
@@ -28,33 +87,11 @@ def format_date_iso8601(date_value: Any) -> Optional[str]:
     if isinstance(date_value, datetime):
         return date_value.strftime("%Y-%m-%d")
     
-    # If it's a string, try to parse common formats
+    # If it's a string, parse it based on its shape
     if isinstance(date_value, str):
-        # Try ISO format first
-        try:
-            parsed_date = datetime.fromisoformat(date_value.replace('Z', '+00:00'))
-            return parsed_date.strftime("%Y-%m-%d")
-        except (ValueError, AttributeError):
-            pass
-        
-        # Try common date formats
-        date_formats = [
-            "%Y-%m-%d",
-            "%m/%d/%Y",
-            "%d/%m/%Y",
-            "%Y/%m/%d",
-            "%B %d, %Y",
-            "%b %d, %Y",
-            "%d %B %Y",
-            "%d %b %Y",
-        ]
-        
-        for fmt in date_formats:
-            try:
-                parsed_date = datetime.strptime(date_value.strip(), fmt)
-                return parsed_date.strftime("%Y-%m-%d")
-            except (ValueError, AttributeError):
-                continue
+        parsed_date = _parse_date_string(date_value)
+        if parsed_date is not None:
+            return parsed_date
     
     # If we couldn't parse it, return the original value as string
     return str(date_value) if date_value else None
@@ -70,13 +107,7 @@ def validate_task_structure(task: Dict[str, Any]) -> bool:
     Returns:
         True if task has all required fields, False otherwise
     """
-    required_fields = ['task', 'owner', 'deadline', 'priority', 'category', 'source_email', 'summary']
-    
-    for field in required_fields:
-        if field not in task:
-            return False
-    
-    return True
+    return _REQUIRED_FIELDS <= task.keys()
 
 
 def build_json_structure(sorted_tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -95,7 +126,7 @@ def build_json_structure(sorted_tasks: List[Dict[str, Any]]) -> List[Dict[str, A
         # Validate task structure
         if not validate_task_structure(task):
             # Log warning but continue processing
-            print(f"Warning: Task missing required fields: {task}")
+            logger.warning("Task missing required fields: %s", task)
             continue
         
         # Format the task with proper date handling
@@ -123,7 +154,9 @@ def write_action_items_to_json(sorted_tasks: List[Dict[str, Any]],
     Args:
         sorted_tasks: List of task dictionaries with all required fields
         output_file: Output filename (default: action_items.json)
-        indent: JSON indentation level (default: 2)
+        indent: JSON indentation level (default: 2). orjson only supports
+                2-space indentation, so any non-zero value indents by 2 and
+                0 writes compact JSON.
         
     Returns:
         True if successful, False otherwise
@@ -133,7 +166,7 @@ def write_action_items_to_json(sorted_tasks: List[Dict[str, Any]],
         ValueError: If task list is invalid
     """
     if not sorted_tasks:
-        print("Warning: Empty task list provided")
+        logger.warning("Empty task list provided")
         sorted_tasks = []
     
     try:
@@ -143,24 +176,26 @@ def write_action_items_to_json(sorted_tasks: List[Dict[str, Any]],
         # Create output path in project root
         output_path = Path(output_file)
         
-        # Write JSON to file with UTF-8 encoding
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(formatted_tasks, f, indent=indent, ensure_ascii=False)
+        # Serialize straight to UTF-8 bytes and write them in one call
+        option = orjson.OPT_INDENT_2 if indent else 0
+        data = orjson.dumps(formatted_tasks, option=option)
+        with open(output_path, 'wb') as f:
+            f.write(data)
         
-        print(f"Successfully wrote {len(formatted_tasks)} action items to {output_file}")
+        logger.info("Successfully wrote %d action items to %s", len(formatted_tasks), output_file)
         return True
         
     except IOError as e:
-        print(f"Error: Failed to write to file {output_file}: {e}")
-        print("Possible causes: insufficient permissions, disk space, or invalid path")
+        logger.error("Failed to write to file %s: %s", output_file, e)
+        logger.error("Possible causes: insufficient permissions, disk space, or invalid path")
         raise
         
     except (TypeError, ValueError) as e:
-        print(f"Error: Invalid task data structure: {e}")
+        logger.error("Invalid task data structure: %s", e)
         raise ValueError(f"Task list contains invalid data: {e}")
         
     except Exception as e:
-        print(f"Unexpected error writing JSON file: {e}")
+        logger.error("Unexpected error writing JSON file: %s", e)
         raise
 
 
@@ -200,5 +235,5 @@ def generate_action_items_json(sorted_tasks: List[Dict[str, Any]],
     try:
         write_action_items_to_json(sorted_tasks, output_file)
     except Exception as e:
-        print(f"Failed to generate action items JSON: {e}")
+        logger.error("Failed to generate action items JSON: %s", e)
         raise
@@ -0,0 +1,212 @@
+"""
+LLM Response Cache Module
+
+This module provides a small persistent cache for LLM results. Entries are keyed
+by a hash of the model, prompt version and input text, so re-running the pipeline
+over unchanged emails skips the Ollama call entirely.
+
+Entries are stored as an append-only JSON-lines log: each insert appends one
+line, and the log is compacted when it is loaded.
+"""
+
+import copy
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import orjson
+
+
+logger = logging.getLogger(__name__)
+
+# Default on-disk location of the cache file
+DEFAULT_CACHE_PATH = Path.home() / ".email_scheduler" / "llm_cache.jsonl"
+
+# Entries older than this many seconds are treated as misses (30 days)
+DEFAULT_EXPIRE = 30 * 86400
+
+
+def make_cache_key(*parts: str) -> str:
+    """
+    Build a cache key from the given parts.
+
+    Args:
+        *parts: Strings that identify the cached result (model, prompt version, input...)
+
+    Returns:
+        Hex-encoded SHA-256 digest of the parts joined with '|'
+    """
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """
+    Persistent key-value cache for LLM results backed by a JSON-lines log.
+
+    The log is loaded lazily on first access; later lines override earlier
+    ones for the same key. Inserts append one line per entry, so a write costs
+    the size of the new entries rather than of the whole cache. When the log is
+    loaded, expired and superseded lines are dropped by rewriting it atomically
+    (via os.replace). Access is guarded by a lock so the cache can be shared
+    between threads.
+    """
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH, expire: Optional[float] = DEFAULT_EXPIRE):
+        """
+        Initialize the LLMCache.
+
+        Args:
+            path: Location of the cache log (default: ~/.email_scheduler/llm_cache.jsonl)
+            expire: Maximum entry age in seconds, or None to never expire
+        """
+        self.path = Path(path).expanduser()
+        self.expire = expire
+        self.hits = 0
+        self.misses = 0
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+
+    def get(self, key: str, model: Optional[str] = None) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Cache key built with make_cache_key
+            model: If given, entries recorded for a different model are treated as misses
+
+        Returns:
+            A copy of the cached value, or None on a miss, if the entry has
+            expired, or if it was produced by another model
+        """
+        with self._lock:
+            entry = self._load().get(key)
+
+            if entry is not None and self._is_expired(entry, time.time()):
+                entry = None
+
+            if entry is not None and model is not None and entry.get("model") != model:
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                logger.debug("LLM cache miss (hits=%d, misses=%d)", self.hits, self.misses)
+                return None
+
+            self.hits += 1
+            logger.debug("LLM cache hit (hits=%d, misses=%d)", self.hits, self.misses)
+            return copy.deepcopy(entry["value"])
+
+    def set(self, key: str, value: Any, model: Optional[str] = None) -> None:
+        """
+        Store a JSON-serializable value and append it to the cache log.
+
+        Args:
+            key: Cache key built with make_cache_key
+            value: Value to cache
+            model: Model that produced the value, checked again on lookup
+        """
+        self.set_many({key: value}, model=model)
+
+    def set_many(self, items: Dict[str, Any], model: Optional[str] = None) -> None:
+        """
+        Store several JSON-serializable values with a single append to the log.
+
+        Args:
+            items: Mapping of cache keys (built with make_cache_key) to values
+            model: Model that produced the values, checked again on lookup
+        """
+        if not items:
+            return
+
+        with self._lock:
+            entries = self._load()
+            now = time.time()
+            lines = []
+            for key, value in items.items():
+                entry = {"value": copy.deepcopy(value), "model": model, "ts": now}
+                entries[key] = entry
+                lines.append(orjson.dumps({"key": key, **entry}))
+            self._append(b"\n".join(lines) + b"\n")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return hit/miss counters for this cache instance.
+        """
+        return {"hits": self.hits, "misses": self.misses}
+
+    def _is_expired(self, entry: Dict[str, Any], now: float) -> bool:
+        """
+        Return True if the entry is older than the cache's expiry age.
+        """
+        return self.expire is not None and now - entry.get("ts", 0) > self.expire
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the cache log on first access and compact it if it holds expired,
+        superseded or unreadable lines. Unreadable files start an empty cache.
+        """
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(self.path, "rb") as f:
+                    lines = f.read().splitlines()
+            except FileNotFoundError:
+                return self._entries
+            except OSError as e:
+                logger.warning("Ignoring unreadable LLM cache %s: %s", self.path, e)
+                return self._entries
+
+            now = time.time()
+            for line in lines:
+                try:
+                    record = orjson.loads(line)
+                    key = record.pop("key")
+                except (ValueError, KeyError, AttributeError, TypeError):
+                    continue
+                if self._is_expired(record, now):
+                    self._entries.pop(key, None)
+                else:
+                    self._entries[key] = record
+
+            if len(lines) != len(self._entries):
+                self._compact()
+        return self._entries
+
+    def _append(self, data: bytes) -> None:
+        """
+        Append encoded lines to the cache log. Failures are logged and otherwise ignored.
+        """
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "ab") as f:
+                f.write(data)
+        except OSError as e:
+            logger.warning("Failed to write LLM cache %s: %s", self.path, e)
+
+    def _compact(self) -> None:
+        """
+        Atomically rewrite the log with only the current entries. Failures are
+        logged and otherwise ignored.
+        """
+        data = b"".join(orjson.dumps({"key": key, **entry}) + b"\n"
+                        for key, entry in self._entries.items())
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning("Failed to compact LLM cache %s: %s", self.path, e)
+
+
+# Cache instance shared by the LLM-backed modules
+default_cache = LLMCache()
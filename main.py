@@ -11,10 +11,14 @@ This module orchestrates the complete email processing pipeline:
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Dict, List
 
 # Import dependent modules
 from email_reader import read_email
+from action_extractor import is_trivial_email
 from summarization import summarize_email
 from action_extraction import extract_action_items
 from prioritization import prioritize_tasks
@@ -28,6 +32,101 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Number of emails processed concurrently. Each worker spends most of its time
+# waiting on Ollama HTTP calls, so threads overlap well despite the GIL.
+EMAIL_WORKERS = int(os.getenv("EMAIL_WORKERS", "8"))
+
+
+@dataclass
+class EmailResult:
+    """
+    Outcome of processing a single email.
+    """
+    tasks: List[Dict[str, Any]] = field(default_factory=list)
+    ok: bool = False
+
+
+def _list_email_names(emails_dir: Path) -> List[str]:
+    """
+    Return the sorted names of the .txt files in emails_dir.
+    
+    Uses os.scandir, which reads file types from the directory listing itself,
+    and sorts plain strings rather than Path objects.
+    
+    Args:
+        emails_dir: Directory to scan
+        
+    Returns:
+        Sorted list of email file names
+    """
+    with os.scandir(emails_dir) as entries:
+        names = [entry.name for entry in entries
+                 if entry.name.endswith(".txt") and entry.is_file()]
+    names.sort()
+    return names
+
+
+def _process_one(email_file: Path, idx: int, total_emails: int) -> EmailResult:
+    """
+    Process one email: read → summarize → extract action items.
+    
+    Runs on a worker thread; failures are logged and reported through the
+    returned EmailResult instead of being raised.
+    
+    Args:
+        email_file: Path to the email .txt file
+        idx: 1-based position of the email (for progress logging)
+        total_emails: Total number of emails being processed
+        
+    Returns:
+        EmailResult with the extracted tasks (stamped with source_email) and
+        whether the email was processed successfully
+    """
+    filename = email_file.name
+    logger.info(f"Processing email {idx}/{total_emails}: {filename}...")
+    
+    try:
+        # Step 1: Read email content
+        email_content = read_email(str(email_file))
+        
+        if not email_content:
+            logger.warning(f"Empty email content for {filename}, skipping...")
+            return EmailResult()
+        
+        # Short notifications with no action phrase skip both LLM calls
+        if is_trivial_email(email_content):
+            logger.debug(f"Skipping LLM calls for short non-actionable email {filename}")
+            logger.info(f"No action items found in {filename}")
+            return EmailResult(ok=True)
+        
+        # Step 2: Summarize email
+        logger.debug(f"Summarizing {filename}...")
+        summary = summarize_email(email_content)
+        
+        # Step 3: Extract action items
+        logger.debug(f"Extracting action items from {filename}...")
+        action_items = extract_action_items(email_content, summary)
+        
+        # Step 4: Collect tasks from this email
+        if not action_items:
+            logger.info(f"No action items found in {filename}")
+            return EmailResult(ok=True)
+        
+        # Add source email information to each task in one pass
+        tasks = [{**task, 'source_email': filename} if isinstance(task, dict) else task
+                 for task in action_items]
+        
+        logger.info(f"Extracted {len(tasks)} task(s) from {filename}")
+        return EmailResult(tasks=tasks, ok=True)
+        
+    except FileNotFoundError as e:
+        logger.error(f"File not found error for {filename}: {e}")
+        return EmailResult()
+        
+    except Exception as e:
+        logger.error(f"Error processing {filename}: {e}")
+        return EmailResult()
+
 
 def main():
     """
@@ -35,7 +134,7 @@ def main():
     
     Orchestrates the complete workflow:
     - Loads all email files from emails/ directory
-    - Processes each email sequentially
+    - Processes emails concurrently (EMAIL_WORKERS threads)
     - Aggregates all extracted tasks
     - Applies prioritization
     - Generates JSON output
@@ -54,13 +153,13 @@ def main():
         return
     
     # Load all .txt files from emails directory
-    email_files = sorted(emails_dir.glob("*.txt"))
+    email_names = _list_email_names(emails_dir)
     
-    if not email_files:
+    if not email_names:
         logger.warning("No .txt files found in emails/ directory")
         return
     
-    total_emails = len(email_files)
+    total_emails = len(email_names)
     logger.info(f"Found {total_emails} email(s) to process")
     
     # Master list to collect all tasks from all emails
@@ -68,51 +167,22 @@ def main():
     processed_count = 0
     failed_count = 0
     
-    # Process each email sequentially
-    for idx, email_file in enumerate(email_files, start=1):
-        filename = email_file.name
-        logger.info(f"Processing email {idx}/{total_emails}: {filename}...")
+    # Process emails concurrently; map() yields results in input order, so the
+    # counters and task list are reduced here on the main thread
+    with ThreadPoolExecutor(max_workers=max(1, min(EMAIL_WORKERS, total_emails))) as executor:
+        results = executor.map(
+            _process_one,
+            (emails_dir / name for name in email_names),
+            range(1, total_emails + 1),
+            [total_emails] * total_emails
+        )
         
-        try:
-            # Step 1: Read email content
-            email_content = read_email(str(email_file))
-            
-            if not email_content:
-                logger.warning(f"Empty email content for {filename}, skipping...")
-                failed_count += 1
-                continue
-            
-            # Step 2: Summarize email
-            logger.debug(f"Summarizing {filename}...")
-            summary = summarize_email(email_content)
-            
-            # Step 3: Extract action items
-            logger.debug(f"Extracting action items from {filename}...")
-            action_items = extract_action_items(email_content, summary)
-            
-            # Step 4: Collect tasks from this email
-            if action_items:
-                # Add source email information to each task
-                for task in action_items:
-                    if isinstance(task, dict):
-                        task['source_email'] = filename
-                
-                all_tasks.extend(action_items)
-                logger.info(f"Extracted {len(action_items)} task(s) from {filename}")
+        for result in results:
+            all_tasks.extend(result.tasks)
+            if result.ok:
+                processed_count += 1
             else:
-                logger.info(f"No action items found in {filename}")
-            
-            processed_count += 1
-            
-        except FileNotFoundError as e:
-            logger.error(f"File not found error for {filename}: {e}")
-            failed_count += 1
-            continue
-            
-        except Exception as e:
-            logger.error(f"Error processing {filename}: {e}")
-            failed_count += 1
-            continue
+                failed_count += 1
     
     # Log processing summary
     total_tasks = len(all_tasks)
@@ -0,0 +1,137 @@
+"""
+Ollama Client Module
+
+This module holds the shared Ollama settings and ChatOllama client used by the
+summarizer and the action item extractor, plus helpers for talking to the local
+Ollama server directly (outside of LangChain).
+"""
+
+import functools
+import json
+import logging
+import socket
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from langchain_community.chat_models import ChatOllama
+
+
+logger = logging.getLogger(__name__)
+
+# Quantized (Q4_K_M) llama3.1 build: much faster than fp16 with minor accuracy
+# loss on summarization and structured extraction
+DEFAULT_MODEL = "llama3.1:8b-instruct-q4_K_M"
+
+# Default address of the local Ollama server
+DEFAULT_BASE_URL = "http://localhost:11434"
+
+# How long a preloaded model stays in memory after its last request
+DEFAULT_KEEP_ALIVE = "30m"
+
+
+def get_llm(model_name: str = DEFAULT_MODEL, base_url: str = DEFAULT_BASE_URL) -> ChatOllama:
+    """
+    Return the shared ChatOllama client for a model and server.
+    
+    One instance per (model_name, base_url) pair is created and reused by every
+    module. Callers that need different generation settings bind them per call,
+    e.g. get_llm(model).bind(format="json", temperature=0.1).
+    
+    Args:
+        model_name: Ollama model to use (default: DEFAULT_MODEL)
+        base_url: Base URL for Ollama API (default: http://localhost:11434)
+        
+    Returns:
+        Shared ChatOllama instance
+    """
+    # Always pass both arguments positionally so that, e.g., get_llm(model) and
+    # get_llm(model, DEFAULT_BASE_URL) hit the same cache entry
+    return _cached_llm(model_name, base_url)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_llm(model_name: str, base_url: str) -> ChatOllama:
+    """
+    Create the ChatOllama client for one (model_name, base_url) pair.
+    """
+    return ChatOllama(model=model_name, base_url=base_url)
+
+
+def check_ollama(model_name: str = DEFAULT_MODEL,
+                 base_url: str = DEFAULT_BASE_URL,
+                 timeout: float = 0.25) -> bool:
+    """
+    Check that the Ollama server is reachable and has the model pulled.
+    
+    A short TCP connect to the server's port fails fast when Ollama is not
+    running; only then is /api/tags queried for the list of local models.
+    
+    Args:
+        model_name: Ollama model that must be available (default: DEFAULT_MODEL)
+        base_url: Base URL for Ollama API (default: http://localhost:11434)
+        timeout: Seconds to wait for the TCP connection
+        
+    Returns:
+        True if the server is up and the model is available, False otherwise
+    """
+    url = urllib.parse.urlsplit(base_url)
+    port = url.port or (443 if url.scheme == "https" else 80)
+    
+    try:
+        socket.create_connection((url.hostname or "localhost", port), timeout=timeout).close()
+    except OSError:
+        logger.warning("Ollama is not running at %s. Start it with 'ollama serve'.", base_url)
+        return False
+    
+    try:
+        with urllib.request.urlopen(f"{base_url.rstrip('/')}/api/tags", timeout=5.0) as response:
+            models = json.loads(response.read()).get("models", [])
+    except (urllib.error.URLError, OSError, ValueError) as e:
+        logger.warning("Could not list Ollama models: %s", e)
+        return False
+    
+    # Untagged names refer to the ':latest' tag
+    wanted = model_name if ":" in model_name else f"{model_name}:latest"
+    if not any(model.get("name") == wanted for model in models):
+        logger.warning("Model '%s' not found. Pull it with 'ollama pull %s'.", model_name, model_name)
+        return False
+    
+    return True
+
+
+def preload_model(model_name: str = DEFAULT_MODEL,
+                  base_url: str = DEFAULT_BASE_URL,
+                  keep_alive: str = DEFAULT_KEEP_ALIVE,
+                  timeout: float = 300.0) -> bool:
+    """
+    Load a model into Ollama's memory ahead of the first real request.
+
+    Sends an empty generate request, which makes Ollama load the model without
+    producing any output, and pins it for keep_alive. This moves the multi-second
+    cold start out of the first email's processing time.
+
+    Args:
+        model_name: Ollama model to load (default: DEFAULT_MODEL)
+        base_url: Base URL for Ollama API (default: http://localhost:11434)
+        keep_alive: How long Ollama should keep the model loaded (default: 30m)
+        timeout: Seconds to wait for the model to load
+
+    Returns:
+        True if the model was loaded, False otherwise
+    """
+    payload = json.dumps({"model": model_name, "keep_alive": keep_alive}).encode("utf-8")
+    request = urllib.request.Request(
+        f"{base_url.rstrip('/')}/api/generate",
+        data=payload,
+        headers={"Content-Type": "application/json"},
+        method="POST"
+    )
+
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+        return True
+    except (urllib.error.URLError, OSError) as e:
+        logger.warning("Could not preload model '%s': %s", model_name, e)
+        return False
@@ -2,14 +2,26 @@
 Email Summarization Module using LangChain and Ollama.
 
 This module provides functionality to generate concise summaries of email content,
-focusing on key points and action items using the llama3.1 model via ChatOllama.
+focusing on key points and action items using a llama3.1 model via ChatOllama.
 """
 
+import hashlib
+import logging
+import re
 from langchain_community.chat_models import ChatOllama
 from langchain.prompts import PromptTemplate
-from langchain.chains import LLMChain
 from typing import Optional
 
+from ollama_client import DEFAULT_MODEL, DEFAULT_BASE_URL, get_llm
+from llm_cache import LLMCache, default_cache, make_cache_key
+
+
+logger = logging.getLogger(__name__)
+
+# A sentence break: one or more periods plus any whitespace between them, so
+# runs like ". ." do not produce empty sentences
+_SENTENCE_BREAK_RE = re.compile(r'(?:\.\s*)+')
+
 
 class EmailSummarizer:
     """
@@ -19,20 +31,32 @@ class EmailSummarizer:
     - Main topics and key points
     - Action items and deadlines
     - Essential context for quick understanding
+    
+    Summaries are cached on disk, keyed by model, temperature, prompt and email
+    text, so unchanged emails are not re-summarized on later runs.
     """
     
-    def __init__(self, model_name: str = "llama3.1", temperature: float = 0.4):
+    def __init__(self, model_name: str = DEFAULT_MODEL, temperature: float = 0.4,
+                 cache: Optional[LLMCache] = None, llm: Optional[ChatOllama] = None,
+                 base_url: str = DEFAULT_BASE_URL):
         """
         Initialize the EmailSummarizer with ChatOllama LLM.
         
         Args:
-            model_name: Ollama model to use (default: llama3.1)
+            model_name: Ollama model to use (default: DEFAULT_MODEL)
             temperature: LLM temperature for consistency (0.3-0.5 recommended)
+            cache: Summary cache (default: the shared llm_cache.default_cache)
+            llm: ChatOllama client serving model_name (default: the shared
+                 client from ollama_client.get_llm)
+            base_url: Base URL for Ollama API, used when llm is not given
+                      (default: http://localhost:11434)
         """
-        self.llm = ChatOllama(
-            model=model_name,
-            temperature=temperature
-        )
+        self.model_name = model_name
+        self._cache = cache if cache is not None else default_cache
+        
+        # Temperature is bound per call so the client itself can be shared
+        client = llm if llm is not None else get_llm(model_name, base_url)
+        self.llm = client.bind(temperature=temperature)
         
         # Design prompt template for concise summarization
         self.prompt_template = PromptTemplate(
@@ -53,11 +77,34 @@ EMAIL TEXT:
 CONCISE SUMMARY (2-3 sentences):"""
         )
         
-        # Create the summarization chain
-        self.chain = LLMChain(
-            llm=self.llm,
-            prompt=self.prompt_template
-        )
+        # The template has a single variable, so prompts are built by plain
+        # concatenation instead of PromptTemplate.format on every call
+        self._prompt_prefix, self._prompt_suffix = self.prompt_template.template.split("{email_text}")
+        
+        # Everything except the email text that determines a summary
+        self._cache_key_prefix = hashlib.sha256(
+            f"{model_name}|{temperature}|{self.prompt_template.template}".encode("utf-8")
+        ).hexdigest()
+    
+    def shortcut_summary(self, email_text: str) -> Optional[str]:
+        """
+        Return the fixed summary for empty or very short emails.
+        
+        Args:
+            email_text: Raw email content as a string
+            
+        Returns:
+            Summary string, or None if the email needs a real summary
+        """
+        # Handle edge case: empty or None input
+        if not email_text or not email_text.strip():
+            return "Empty email with no content."
+        
+        # Handle edge case: very short email
+        if len(email_text.strip()) < 20:
+            return f"Brief message: {email_text.strip()}"
+        
+        return None
     
     def summarize(self, email_text: str) -> str:
         """
@@ -73,34 +120,41 @@ CONCISE SUMMARY (2-3 sentences):"""
             ValueError: If email_text is empty or None
             Exception: If LLM processing fails
         """
-        # Handle edge case: empty or None input
-        if not email_text or not email_text.strip():
-            return "Empty email with no content."
+        shortcut = self.shortcut_summary(email_text)
+        if shortcut is not None:
+            return shortcut
         
-        # Handle edge case: very short email
-        if len(email_text.strip()) < 20:
-            return f"Brief message: {email_text.strip()}"
+        # Reuse a previous summary of the same email if there is one
+        cache_key = make_cache_key(self._cache_key_prefix, email_text)
+        cached = self._cache.get(cache_key, model=self.model_name)
+        if cached is not None:
+            return cached
         
         try:
-            # Run the chain to generate summary
-            result = self.chain.run(email_text=email_text)
+            # Call the model directly; an LLMChain adds callback and
+            # input/output key handling on every call
+            message = self.llm.invoke(self._prompt_prefix + email_text + self._prompt_suffix)
+            result = message.content if hasattr(message, "content") else str(message)
             
             # Clean up the output
             summary = result.strip()
             
             # Handle edge case: ensure summary isn't too long
-            # Split into sentences and take first 3 at most
-            sentences = [s.strip() for s in summary.split('.') if s.strip()]
-            if len(sentences) > 3:
-                summary = '. '.join(sentences[:3]) + '.'
+            # Split off at most the first 3 sentences; anything left over in
+            # the 4th part means the summary ran long. Leading periods (e.g. an
+            # ellipsis) are skipped so they don't count as an empty sentence.
+            parts = _SENTENCE_BREAK_RE.split(summary.lstrip('. \t\r\n'), 3)
+            if len(parts) > 3 and parts[3].strip():
+                summary = '. '.join(p.strip() for p in parts[:3] if p.strip()) + '.'
             elif not summary.endswith('.'):
                 summary += '.'
             
+            self._cache.set(cache_key, summary, model=self.model_name)
             return summary
             
         except Exception as e:
             # Log error and return fallback summary
-            print(f"Error generating summary: {str(e)}")
+            logger.error("Error generating summary: %s", e)
             # Provide a basic fallback
             words = email_text.split()[:30]
             fallback = ' '.join(words)
@@ -109,18 +163,20 @@ CONCISE SUMMARY (2-3 sentences):"""
             return f"Summary unavailable. Preview: {fallback}"
 
 
-def create_summarizer(model_name: str = "llama3.1", temperature: float = 0.4) -> EmailSummarizer:
+def create_summarizer(model_name: str = DEFAULT_MODEL, temperature: float = 0.4,
+                      llm: Optional[ChatOllama] = None) -> EmailSummarizer:
     """
     Factory function to create an EmailSummarizer instance.
     
     Args:
-        model_name: Ollama model to use (default: llama3.1)
+        model_name: Ollama model to use (default: DEFAULT_MODEL)
         temperature: LLM temperature for consistency (default: 0.4)
+        llm: ChatOllama client to use (default: the shared client)
         
     Returns:
         Configured EmailSummarizer instance
     """
-    return EmailSummarizer(model_name=model_name, temperature=temperature)
+    return EmailSummarizer(model_name=model_name, temperature=temperature, llm=llm)
 
 
 # Example usage and testing